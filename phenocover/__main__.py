@@ -1,10 +1,16 @@
 """Entry point script."""
 
+import sys
 
-from phenocover import cli, __app_name__
+from phenocover import __app_name__, __version__
 
 
 def main():
+    # Answer a bare --version before typer/click/rich are imported
+    if sys.argv[1:] in (["--version"], ["-v"]):
+        print(f"{__app_name__} v{__version__}")
+        return
+    from phenocover import cli
     cli.app(prog_name=__app_name__)
 
 
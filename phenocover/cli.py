@@ -28,40 +28,55 @@ Usage:
     python -m phenocover generate-config --format yaml --output config.yml
 """
 
+import os
 import typer
 import json
-import yaml
+import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
-from rich.table import Table
 from phenocover import __app_name__, __version__
 from phenocover.logging import configure_logging, get_logger
-from phenocover.utils import clear
-from phenocover.wheat_phenology_analyzer import WheatPhenologyAnalyzer
 
 # Logger
 logger = get_logger(__name__)
-configure_logging(
-    level="INFO",
-    log_dir="./logs",
-    enable_file_logging=True,
-    enable_console_logging=True,
-    use_rich=True,
-    suppress_third_party_debug=True
-)
+
 # Main app
 app = typer.Typer()
-console = Console()
+
+
+def _ensure_logging() -> None:
+    """Configure logging for the command that is about to run.
+
+    Repeat calls are cheap: configure_logging is a no-op when the
+    settings have not changed.
+    """
+    level = os.environ.get("PHENOCOVER_LOG_LEVEL", "INFO").upper()
+    invalid_level = not isinstance(logging.getLevelName(level), int)
+    configure_logging(
+        level="INFO" if invalid_level else level,
+        log_dir="./logs",
+        enable_file_logging=True,
+        enable_console_logging=True,
+        use_rich=True,
+        suppress_third_party_debug=True
+    )
+    if invalid_level:
+        logger.warning(
+            f"Unknown PHENOCOVER_LOG_LEVEL '{level}', falling back to INFO")
+
+
+@lru_cache(maxsize=None)
+def _console():
+    """Return the shared rich console, created on first use."""
+    from rich.console import Console
+    return Console()
 
 
 # Main callback
 
 
 def _version_callback(value: bool) -> None:
-    clear()
     if value:
         typer.echo(f"{__app_name__} v{__version__}")
         raise typer.Exit()
@@ -151,6 +166,8 @@ def phenology_analyzer(
     Parameters can be provided via command-line options or a configuration file.
     Command-line options override configuration file values.
     """
+    _ensure_logging()
+    console = _console()
     try:
         # Load configuration from file if provided
         params = {}
@@ -248,6 +265,8 @@ def generate_config(
     Creates a template configuration file with all available parameters
     and example values.
     """
+    _ensure_logging()
+    console = _console()
     try:
         # Sample configuration
         sample_config = {
@@ -279,6 +298,7 @@ def generate_config(
             output = Path(f"config.{format}")
 
         # Write configuration
+        import yaml
         with open(output, 'w') as f:
             if format.lower() == 'yaml':
                 yaml.dump(sample_config, f,
@@ -306,6 +326,7 @@ def generate_config(
 
 def _load_config(config_path: Path) -> dict:
     """Load configuration from YAML or JSON file."""
+    import yaml
     with open(config_path, 'r') as f:
         if config_path.suffix.lower() in ['.yaml', '.yml']:
             return yaml.safe_load(f)
@@ -318,7 +339,8 @@ def _load_config(config_path: Path) -> dict:
 
 def _display_header():
     """Display analysis header."""
-    console.print(Panel.fit(
+    from rich.panel import Panel
+    _console().print(Panel.fit(
         "[bold cyan]WEATHER-ENHANCED WHEAT PHENOLOGY ANALYSIS[/bold cyan]\n"
         "Real weather data from Open-Meteo API (free, no API key)\n"
         "Weather-informed growth stage estimation\n"
@@ -330,6 +352,7 @@ def _display_header():
 
 def _display_config(params: dict):
     """Display configuration table."""
+    from rich.table import Table
     table = Table(title="Analysis Configuration",
                   show_header=True, header_style="bold magenta")
     table.add_column("Parameter", style="cyan")
@@ -349,11 +372,15 @@ def _display_config(params: dict):
     table.add_row("Visualization PNG", params.get(
         'visualization_png', 'phenology_analysis.png'))
 
-    console.print(table)
+    _console().print(table)
 
 
 def _run_analysis(params: dict):
     """Run the phenology analysis."""
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from phenocover.wheat_phenology_analyzer import WheatPhenologyAnalyzer
+    console = _console()
     logger.info("Starting phenology analysis")
 
     with Progress(
@@ -444,3 +471,7 @@ def _run_analysis(params: dict):
     ))
 
     logger.info("Analysis completed successfully")
+
+
+if __name__ == "__main__":
+    app(prog_name=__app_name__)
@@ -16,30 +16,75 @@ __email__ = "joseph.gitahi@tum.de"
 __maintainer__ = "Joseph Gitahi"
 __year__ = "2025"
 
+import atexit
+import copy
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Union
 
-try:
-    from rich import print as rich_print
-    from rich.console import Console
-    from rich.logging import RichHandler
-    from rich.traceback import install
-    RICH_AVAILABLE = True
-except ImportError:
-    rich_print = None
-    Console = None
-    RichHandler = None
-    install = None
-    RICH_AVAILABLE = False
+# Rich is imported on first use; RICH_AVAILABLE stays None until then
+rich_print = None
+Console = None
+RichHandler = None
+install = None
+RICH_AVAILABLE = None
+
+
+def _try_import_rich() -> bool:
+    """Import rich on first call and cache whether it is available."""
+    global rich_print, Console, RichHandler, install, RICH_AVAILABLE
+    if RICH_AVAILABLE is None:
+        try:
+            from rich import print as rich_print
+            from rich.console import Console
+            from rich.logging import RichHandler
+            from rich.traceback import install
+            RICH_AVAILABLE = True
+        except ImportError:
+            RICH_AVAILABLE = False
+    return RICH_AVAILABLE
+
+
+# Third-party loggers that are typically too verbose at DEBUG level
+_NOISY_LOGGERS = (
+    'urllib3.connectionpool',
+    'requests.packages.urllib3.connectionpool',
+    'urllib3',
+    'requests',
+    'matplotlib',
+    'PIL',
+    'fiona',
+    'rasterio',
+    'boto3',
+    'botocore',
+    's3transfer',
+)
 
 # Ensure we always have print available
 print = print  # Built-in print function
 
 
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that merges the message before enqueueing.
+
+    Args are formatted on the calling thread so later mutation cannot
+    change what is written. exc_info is kept, and the rest of the
+    formatting is left to the file handler.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 class Logger:
     """
     A comprehensive logging class for the phenocover package.
@@ -48,44 +93,57 @@ class Logger:
     console and file logging, with optional rich formatting.
     """
 
-    _instance = None
-    _initialized = False
-
-    def __new__(cls):
-        """Singleton pattern to ensure only one logger instance."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    __slots__ = (
+        'console',
+        '_log_dir',
+        '_config_hash',
+        '_formatters',
+        '_rich_traceback_installed',
+        '_listener',
+        '_created_dirs',
+    )
 
     def __init__(self):
-        """Initialize the logger if not already initialized."""
-        if not self._initialized:
+        """Initialize the logger."""
+        # Rich console is created lazily by _get_console()
+        self.console = None
+        self._log_dir = None
+        self._config_hash = None
+        self._formatters = {}
+        self._rich_traceback_installed = False
+        self._listener = None
+        self._created_dirs = set()
+        atexit.register(self._stop_listener)
+
+    def _get_console(self):
+        """Create the rich console on first use, if rich is available."""
+        if self.console is None and _try_import_rich():
             # Initialize console with safer settings for Windows
-            if RICH_AVAILABLE and Console:
-                try:
-                    # Try to create console with safer width/height settings
-                    self.console = Console(
-                        # Limit width to prevent buffer issues
-                        # width=min(120, 80),
-                        # height=min(50, 30),  # Limit height
-                        force_terminal=True,  # Let Rich detect terminal capabilities
-                        legacy_windows=True   # Better Windows compatibility
-                    )
-                except Exception:
-                    # Fallback to None if Rich console creation fails
-                    self.console = None
-            else:
+            try:
+                self.console = Console(
+                    force_terminal=True,  # Let Rich detect terminal capabilities
+                    legacy_windows=True   # Better Windows compatibility
+                )
+            except Exception:
+                # Leave as None if Rich console creation fails
                 self.console = None
-
-            self._loggers = {}
-            self._log_dir = None
-            self._setup_rich_traceback()
-            Logger._initialized = True
+        return self.console
 
     def _setup_rich_traceback(self):
         """Setup rich traceback handling if available."""
-        if RICH_AVAILABLE and install and self.console:
+        if self._rich_traceback_installed:
+            return
+        if _try_import_rich() and self._get_console():
             install(show_locals=True, console=self.console)
+            self._rich_traceback_installed = True
+
+    def _stop_listener(self):
+        """Flush pending records and close the handlers of the listener."""
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
 
     def configure_logging(
         self,
@@ -95,7 +153,7 @@ class Logger:
         enable_file_logging: bool = True,
         enable_console_logging: bool = True,
         use_rich: bool = True,
-        max_file_size: int = 10 * 1024 * 1024,  # 10MB
+        max_file_size: int = 100 * 1024 * 1024,  # 100MB
         backup_count: int = 5,
         format_string: Optional[str] = None,
         suppress_third_party_debug: bool = True
@@ -106,7 +164,7 @@ class Logger:
         Args:
             level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
             log_dir: Directory for log files (defaults to ./logs)
-            log_filename: Log file name (defaults to wheat-phenology-estimator_YYYY-MM-DD.log)
+            log_filename: Log file name (defaults to phenocover_YYYY-MM-DD.log)
             enable_file_logging: Whether to enable file logging
             enable_console_logging: Whether to enable console logging
             use_rich: Whether to use rich formatting for console output
@@ -119,6 +177,16 @@ class Logger:
         if isinstance(level, str):
             level = getattr(logging, level.upper())
 
+        # Skip reconfiguration if nothing changed since the last call
+        config_hash = (
+            level, str(log_dir), log_filename, enable_file_logging,
+            enable_console_logging, use_rich, max_file_size, backup_count,
+            format_string, suppress_third_party_debug
+        )
+        if config_hash == self._config_hash:
+            return
+        self._config_hash = config_hash
+
         # Setup log directory
         if log_dir is None:
             log_dir = Path('./logs')
@@ -127,8 +195,9 @@ class Logger:
 
         self._log_dir = log_dir
 
-        if enable_file_logging:
-            log_dir.mkdir(exist_ok=True)
+        if enable_file_logging and str(log_dir) not in self._created_dirs:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(str(log_dir))
 
         # Setup log filename
         if log_filename is None:
@@ -142,6 +211,7 @@ class Logger:
         # Clear existing handlers
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+        self._stop_listener()
 
         # Setup formatters
         if format_string is None:
@@ -150,10 +220,8 @@ class Logger:
                 '%(funcName)s:%(lineno)d - %(message)s'
             )
 
-        file_formatter = logging.Formatter(
-            format_string,
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        file_formatter = self._get_formatter(
+            format_string, '%Y-%m-%d %H:%M:%S')
 
         # Setup file logging
         if enable_file_logging:
@@ -162,15 +230,27 @@ class Logger:
                 log_file,
                 maxBytes=max_file_size,
                 backupCount=backup_count,
-                encoding='utf-8'
+                encoding='utf-8',
+                delay=True  # Open the file on first emit
             )
-            file_handler.setLevel(level)
             file_handler.setFormatter(file_formatter)
-            root_logger.addHandler(file_handler)
+
+            # Write through a background listener so file I/O and
+            # rotation do not block the calling thread
+            log_queue = queue.SimpleQueue()
+            # Filter by level on the calling thread, so records already
+            # queued are not dropped by a later set_level
+            queue_handler = _LocalQueueHandler(log_queue)
+            queue_handler.setLevel(level)
+            root_logger.addHandler(queue_handler)
+            self._listener = logging.handlers.QueueListener(
+                log_queue, file_handler)
+            self._listener.start()
 
         # Setup console logging
         if enable_console_logging:
-            if use_rich and RICH_AVAILABLE and RichHandler and self.console:
+            if use_rich and _try_import_rich() and self._get_console():
+                self._setup_rich_traceback()
                 try:
                     console_handler = RichHandler(
                         console=self.console,
@@ -185,48 +265,34 @@ class Logger:
                     # Fallback to standard console handler if Rich fails
                     console_handler = logging.StreamHandler(sys.stdout)
                     console_handler.setLevel(level)
-                    console_formatter = logging.Formatter(
+                    console_formatter = self._get_formatter(
                         '%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-                        datefmt='%H:%M:%S'
+                        '%H:%M:%S'
                     )
                     console_handler.setFormatter(console_formatter)
                     root_logger.addHandler(console_handler)
             else:
                 console_handler = logging.StreamHandler(sys.stdout)
                 console_handler.setLevel(level)
-                console_formatter = logging.Formatter(
+                console_formatter = self._get_formatter(
                     '%(asctime)s - %(levelname)s - %(name)s - %(message)s',
-                    datefmt='%H:%M:%S'
+                    '%H:%M:%S'
                 )
                 console_handler.setFormatter(console_formatter)
                 root_logger.addHandler(console_handler)
 
         # Suppress noisy third-party debug logs if requested
-        if suppress_third_party_debug:
-            # Convert level to int if it's a string for comparison
-            level_int = level if isinstance(
-                level, int) else getattr(logging, level.upper())
-
-            if level_int <= logging.DEBUG:
-                # List of third-party loggers that are typically too verbose at DEBUG level
-                noisy_loggers = [
-                    'urllib3.connectionpool',
-                    'requests.packages.urllib3.connectionpool',
-                    'urllib3',
-                    'requests',
-                    'matplotlib',
-                    'PIL',
-                    'fiona',
-                    'rasterio',
-                    'boto3',
-                    'botocore',
-                    's3transfer'
-                ]
-
-                for logger_name in noisy_loggers:
-                    third_party_logger = logging.getLogger(logger_name)
-                    # Suppress DEBUG messages
-                    third_party_logger.setLevel(logging.INFO)
+        if suppress_third_party_debug and level <= logging.DEBUG:
+            for logger_name in _NOISY_LOGGERS:
+                # Suppress DEBUG messages
+                logging.getLogger(logger_name).setLevel(logging.INFO)
+
+    def _get_formatter(self, fmt: str, datefmt: str) -> logging.Formatter:
+        """Return a cached formatter for the given format strings."""
+        key = (fmt, datefmt)
+        if key not in self._formatters:
+            self._formatters[key] = logging.Formatter(fmt, datefmt=datefmt)
+        return self._formatters[key]
 
     def get_logger(self, name: str) -> logging.Logger:
         """
@@ -238,9 +304,7 @@ class Logger:
         Returns:
             Logger instance
         """
-        if name not in self._loggers:
-            self._loggers[name] = logging.getLogger(name)
-        return self._loggers[name]
+        return logging.getLogger(name)
 
     def log_error(self, error: Exception, context: Optional[str] = None, **kwargs) -> None:
         """
@@ -274,6 +338,8 @@ class Logger:
 
         root_logger = logging.getLogger()
         root_logger.setLevel(level)
+        # Force the next configure_logging call to rebuild handlers
+        self._config_hash = None
 
         for handler in root_logger.handlers:
             handler.setLevel(level)
@@ -286,7 +352,9 @@ class Logger:
             List of log file paths
         """
         if self._log_dir and self._log_dir.exists():
-            return list(self._log_dir.glob('*.log*'))
+            with os.scandir(self._log_dir) as entries:
+                return [Path(entry.path) for entry in entries
+                        if '.log' in entry.name and entry.is_file()]
         return []
 
     def cleanup_old_logs(self, max_age_days: int = 30) -> None:
@@ -301,20 +369,24 @@ class Logger:
 
         cutoff_time = datetime.now().timestamp() - (max_age_days * 24 * 60 * 60)
 
-        for log_file in self._log_dir.glob('*.log*'):
-            if log_file.stat().st_mtime < cutoff_time:
+        with os.scandir(self._log_dir) as entries:
+            for entry in entries:
+                if '.log' not in entry.name or not entry.is_file():
+                    continue
                 try:
-                    log_file.unlink()
+                    if entry.stat().st_mtime >= cutoff_time:
+                        continue
+                    os.unlink(entry.path)
                     self.get_logger('phenocover.maintenance').info(
-                        f"Removed old log file: {log_file.name}"
+                        f"Removed old log file: {entry.name}"
                     )
                 except OSError as e:
                     self.get_logger('phenocover.maintenance').error(
-                        f"Failed to remove log file {log_file.name}: {e}"
+                        f"Failed to remove log file {entry.name}: {e}"
                     )
 
 
-# Global logger instance
+# Global logger instance (module caching makes it a singleton)
 logger_instance = Logger()
 
 # Convenience functions
@@ -332,12 +404,9 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     if name is None:
         # Get the calling module name
-        import inspect
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            name = frame.f_back.f_globals.get(
-                '__name__', 'phenocover')
-        else:
+        try:
+            name = sys._getframe(1).f_globals.get('__name__', 'phenocover')
+        except ValueError:
             name = 'phenocover'
 
     # Ensure name is not None at this point
@@ -2,11 +2,10 @@
 
 '''Utility functions for Phenocover'''
 import os
+import re
 import sys
 import time
-import requests
 from functools import wraps
-from rich import print
 from pathlib import Path
 from phenocover.logging import get_logger
 
@@ -17,19 +16,34 @@ __year__ = "2025"
 
 logger = get_logger(__name__)
 
+# Shared HTTP session, created on first request
+_session = None
+
+# orjson module if installed (False if not), resolved on first request
+_orjson = None
+
+# orjson decodes integers beyond 64 bits as lossy floats
+_LONG_DIGITS = re.compile(rb'\d{20,}')
+
 
 def clear():
     '''Clears Console'''
+    # Write the ANSI clear sequence directly instead of spawning a shell
+    if sys.stdout.isatty() and os.environ.get('TERM', '') not in ('', 'dumb'):
+        sys.stdout.write('\x1b[2J\x1b[H')
+        sys.stdout.flush()
+        return
     os.system('cls' if os.name == 'nt' else 'clear')
 
 
 def timeit(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
+        from rich import print as rich_print
         start = time.perf_counter()
         result = func(*args, **kwargs)
         end = time.perf_counter()
-        print(
+        rich_print(
             f'[blue]{func.__name__} took {end - start:.6f} seconds to complete')
         return result
     return wrapper
@@ -44,47 +58,95 @@ def get_file_extension(file_path: Path) -> str:
 
 
 def get_files(input_dir: str, extensions: list) -> list:
-    '''Returns a list of files with the specified extensions in the input directory'''
-    files = []
-    for file in os.listdir(input_dir):
-        if file.endswith(tuple(extensions)):
-            files.append(os.path.join(input_dir, file))
-    return files
-
-
-def fetch_data(url) -> dict:
+    '''Returns a list of files with the specified extensions in the input directory
+
+    Extensions are matched case-insensitively, with or without a leading dot.
+    '''
+    ext_set = {(ext if ext.startswith('.') else f'.{ext}').lower()
+               for ext in extensions}
+    with os.scandir(input_dir) as entries:
+        return [entry.path for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in ext_set
+                and entry.is_file()]
+
+
+def _get_session():
+    '''Returns a shared requests session so repeated calls reuse connections'''
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
+
+def _get_orjson():
+    '''Returns the orjson module if it is installed, otherwise False'''
+    global _orjson
+    if _orjson is None:
+        try:
+            import orjson
+            _orjson = orjson
+        except ImportError:
+            _orjson = False
+    return _orjson
+
+
+def fetch_data(url, timeout: float = 30) -> dict:
     """Fetch data from an API
 
     Args:
         url (_type_): API URL
+        timeout (float): Request timeout in seconds
     Returns:
         response (_type_): API response
     """
+    import requests
+
     response = None
     try:
-        response = requests.get(url)
+        response = _get_session().get(url, timeout=timeout)
         response.raise_for_status()
     except requests.exceptions.RequestException as e:
         logger.error(f'An error occurred while fetching data: {e}')
         sys.exit(1)
+    # Use orjson only where it decodes exactly like response.json()
+    orjson = _get_orjson()
+    if orjson and not _LONG_DIGITS.search(response.content):
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass
     return response.json()
 
 
-def fetch_sensorthingsapi(url) -> list:
-    """Fetch SensorThings Paginated API endpoint
+def iter_sensorthingsapi(url):
+    """Iterate over the entities of a SensorThings Paginated API endpoint
+
+    Pages are fetched lazily, so only one page is held in memory at a time.
 
     Args:
         url (_type_): API URL
 
-    Returns:
-        json (_type_): JSON data
+    Yields:
+        entity (dict): JSON entity
     """
 
     data = fetch_data(url)
-    fetched_entities = data['value']
+    yield from data['value']
 
     while data.get('@iot.nextLink'):
         data = fetch_data(data['@iot.nextLink'])
-        fetched_entities.extend(data['value'])
+        yield from data['value']
+
+
+def fetch_sensorthingsapi(url) -> list:
+    """Fetch SensorThings Paginated API endpoint
+
+    Args:
+        url (_type_): API URL
+
+    Returns:
+        json (_type_): JSON data
+    """
 
-    return fetched_entities
+    return list(iter_sensorthingsapi(url))
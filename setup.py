@@ -64,10 +64,13 @@ setup(
             "flake8>=6.0",
             "mypy>=1.0",
         ],
+        "fast": [
+            "orjson>=3.0",
+        ],
     },
     entry_points={
         "console_scripts": [
-            "phenocover=phenocover.cli:app",
+            "phenocover=phenocover.__main__:main",
         ],
     },
     include_package_data=True,